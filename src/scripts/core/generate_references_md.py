@@ -5,7 +5,15 @@ Sorts entries by author surname and creates Harvard-style markdown.
 """
 
 import json
+import os
+import re
 from pathlib import Path
+
+try:
+    import orjson  # optional, faster JSON parsing
+except ImportError:
+    orjson = None
+
 from src.lib.config import REFERENCES_JSON, REFERENCES_FILE
 from src.lib.utils import create_harvard_reference
 
@@ -38,14 +46,8 @@ def parse_author_names(author_str):
 
     # Handle "and" separators
     if " and " in author_str:
-        # Split on "and" and clean up commas
-        parts = author_str.split(" and ")
-        names = []
-        for part in parts:
-            # Remove trailing commas from parts before "and"
-            cleaned = part.strip().rstrip(",")
-            names.append(cleaned)
-        return names
+        # Split on "and", removing trailing commas from parts before "and"
+        return [part.strip().rstrip(",") for part in author_str.split(" and ")]
     # Handle comma separators
     elif ", " in author_str:
         return [a.strip() for a in author_str.split(",")]
@@ -53,47 +55,148 @@ def parse_author_names(author_str):
         return [author_str.strip()]
 
 
-def generate_markdown():
-    """Generate references.md from references.json."""
+HEADER_LINES = [
+    "# References\n",
+    "\n",
+    "Harvard-style bibliography of processed documents.\n",
+    "\n",
+    "---\n",
+    "\n",
+]
+
+# The **File**: line that closes each bibliography block
+FILE_LINE_PATTERN = re.compile(r"^\*\*File\*\*:[ \t]*(.+)$", re.MULTILINE)
+
+
+def load_json(json_path):
+    """Load a JSON file, parsing with orjson when it is installed."""
+    with open(json_path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Stricter than json: rejects NaN and lone surrogates that
+            # json.dump writes for badly decoded PDF metadata
+            pass
+    return json.loads(data)
+
+
+def format_entry(entry):
+    """Format a references.json entry as a markdown block."""
+    author_names = parse_author_names(entry["author"])
+    year = entry["year"] if entry["year"] else None
+
+    harvard_ref = create_harvard_reference(
+        author_names,
+        year,
+        entry["title"],
+        entry["publisher"] if entry["publisher"] else None,
+        entry["filename"],
+    )
+    return harvard_ref + "\n\n"
+
+
+def write_atomic(lines):
+    """Write lines to references.md via a temp file and os.replace."""
+    tmp_file = REFERENCES_FILE.with_suffix(".md.tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_file, REFERENCES_FILE)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def split_blocks(content):
+    """
+    Split an existing references.md into (filename, block) pairs.
+
+    Each block runs from the end of the previous block (or the header) up to
+    and including its **File**: line and is kept verbatim, so entries whose
+    reference spans several lines survive. Returns None if the header is
+    missing or text follows the last block.
+    """
+    header = "".join(HEADER_LINES)
+    if not content.startswith(header):
+        return None
+
+    blocks = []
+    start = len(header)
+    for match in FILE_LINE_PATTERN.finditer(content, start):
+        end = match.end()
+        block = content[start:end].strip("\n") + "\n\n"
+        blocks.append((match.group(1).strip(), block))
+        start = end
+
+    if content[start:].strip():
+        return None
+    return blocks
+
+
+def patch_markdown(entries, dirty):
+    """
+    Re-render only the blocks for filenames in dirty, keeping all other
+    blocks from the existing references.md as-is.
+
+    dirty should contain both old and new filenames of changed entries so
+    that renamed/removed blocks are dropped and their replacements added.
+    Returns False without writing if the existing file cannot be split.
+    """
+    with open(REFERENCES_FILE, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    existing = split_blocks(content)
+    if existing is None:
+        return False
+
+    blocks = [
+        (filename, block) for filename, block in existing if filename not in dirty
+    ]
+    blocks.extend(
+        (entry["filename"], format_entry(entry))
+        for entry in entries
+        if entry["filename"] in dirty
+    )
+    blocks.sort(key=lambda b: b[0].lower())
+
+    write_atomic(HEADER_LINES + [block for _, block in blocks])
+
+    print(f"✓ Patched {REFERENCES_FILE}")
+    print(f"  {len(dirty)} changed filenames, {len(blocks)} entries total")
+    return True
+
+
+def generate_markdown(dirty=None):
+    """
+    Generate references.md from references.json.
+
+    If dirty (a set of filenames) is given and references.md already exists,
+    only those entries are re-rendered; otherwise the file is rebuilt.
+    """
     # Load JSON
     if not REFERENCES_JSON.exists():
         print(f"❌ {REFERENCES_JSON} not found")
         return False
 
-    with open(REFERENCES_JSON, "r", encoding="utf-8") as f:
-        entries = json.load(f)
+    entries = load_json(REFERENCES_JSON)
 
     print(f"Loaded {len(entries)} entries from {REFERENCES_JSON}")
 
+    if dirty is not None and REFERENCES_FILE.exists():
+        if patch_markdown(entries, dirty):
+            return True
+        print(f"  Unrecognised layout in {REFERENCES_FILE}, rebuilding")
+
     # Sort by filename (matches directory listing order)
     sorted_entries = sorted(entries, key=lambda e: e["filename"].lower())
 
     # Generate markdown
-    lines = [
-        "# References\n",
-        "\n",
-        "Harvard-style bibliography of processed documents.\n",
-        "\n",
-        "---\n",
-        "\n",
-    ]
-
-    for entry in sorted_entries:
-        author_names = parse_author_names(entry["author"])
-        year = entry["year"] if entry["year"] else None
-
-        harvard_ref = create_harvard_reference(
-            author_names,
-            year,
-            entry["title"],
-            entry["publisher"] if entry["publisher"] else None,
-            entry["filename"],
-        )
-        lines.append(harvard_ref + "\n\n")
+    lines = HEADER_LINES + [format_entry(entry) for entry in sorted_entries]
 
     # Write to file
-    with open(REFERENCES_FILE, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+    write_atomic(lines)
 
     print(f"✓ Generated {REFERENCES_FILE}")
     print(f"  {len(sorted_entries)} entries sorted by filename")
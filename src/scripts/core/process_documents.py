@@ -29,8 +29,6 @@ from src.lib.utils import (
     regenerate_references_md,
     load_references_json,
     create_reference_stub,
-    check_hash_conflict,
-    check_filename_conflict,
 )
 
 # Configuration
@@ -40,16 +38,27 @@ MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB in bytes
 # Keep only GENERIC_TERMS (used locally in this script)
 GENERIC_TERMS = {"introduction", "guide", "handbook", "manual"}
 
+# Filename/metadata patterns, compiled once rather than per file
+YEAR_PATTERN = re.compile(r"(\d{4})")
+BRACKET_AUTHOR_PATTERN = re.compile(r"\[([^\]]+)\](.+)")  # [Author]Title
+YEAR_AUTHOR_TITLE_PATTERN = re.compile(r"(\d{4})-([^-]+)-(.+)")  # YYYY-Author-Title
+YEAR_BOOK_PATTERN = re.compile(r"(\d{4})_(?:Book|Article)_(.+)")  # YYYY_Book_Title
+ARXIV_PATTERN = re.compile(r"(\d{4}\.\d+)\s*(.+)?")  # arxiv number + title
+
 
 class DocumentProcessor:
     def __init__(self):
         self.processed_files = []
+        self.processed_by_name = {}  # new_filename -> original_filename
+        self.processed_filenames = set()  # new filenames used so far in this batch
         self.log_entries = []
         self.skipped_large = []
         self.skipped_non_pdf = []
         self.errors = []
         self.conflicts = []  # Track files with hash/filename conflicts
         self.existing_references = None  # Pre-loaded references for conflict checking
+        self.references_by_hash = {}  # file_hash -> existing entry
+        self.references_by_filename = {}  # filename -> existing entry
 
     def extract_pdf_metadata(self, pdf_path: Path) -> Dict[str, str]:
         """Extract metadata from PDF file."""
@@ -68,7 +77,7 @@ class DocumentProcessor:
                     for date_key in ["/CreationDate", "/ModDate"]:
                         if date_key in info and info[date_key]:
                             date_str = str(info[date_key])
-                            year_match = re.search(r"(\d{4})", date_str)
+                            year_match = YEAR_PATTERN.search(date_str)
                             if year_match:
                                 metadata["year"] = year_match.group(1)
                                 break
@@ -89,14 +98,14 @@ class DocumentProcessor:
         name = filename.rsplit(".", 1)[0]
 
         # Pattern 1: [Author]Title
-        match = re.match(r"\[([^\]]+)\](.+)", name)
+        match = BRACKET_AUTHOR_PATTERN.match(name)
         if match:
             info["author"] = match.group(1).strip()
             info["title"] = match.group(2).strip()
             return info
 
         # Pattern 2: YYYY-Author-Title
-        match = re.match(r"(\d{4})-([^-]+)-(.+)", name)
+        match = YEAR_AUTHOR_TITLE_PATTERN.match(name)
         if match:
             info["year"] = match.group(1)
             info["author"] = match.group(2).strip()
@@ -104,14 +113,14 @@ class DocumentProcessor:
             return info
 
         # Pattern 3: YYYY_Book_Title or similar
-        match = re.match(r"(\d{4})_(?:Book|Article)_(.+)", name)
+        match = YEAR_BOOK_PATTERN.match(name)
         if match:
             info["year"] = match.group(1)
             info["title"] = match.group(2).strip()
             return info
 
         # Pattern 4: arxiv number + title
-        match = re.match(r"(\d{4}\.\d+)\s*(.+)?", name)
+        match = ARXIV_PATTERN.match(name)
         if match:
             info["title"] = match.group(2).strip() if match.group(2) else match.group(1)
             return info
@@ -120,7 +129,7 @@ class DocumentProcessor:
         info["title"] = name
 
         # Try to extract year from anywhere in filename
-        year_match = re.search(r"(\d{4})", name)
+        year_match = YEAR_PATTERN.search(name)
         if year_match:
             info["year"] = year_match.group(1)
 
@@ -128,10 +137,7 @@ class DocumentProcessor:
 
     def check_duplicate(self, new_filename: str) -> Optional[str]:
         """Check if file already exists in processed list."""
-        for processed in self.processed_files:
-            if processed["new_filename"] == new_filename:
-                return processed["original_filename"]
-        return None
+        return self.processed_by_name.get(new_filename)
 
     def process_file(self, file_path: Path) -> bool:
         """Process a single PDF file with pre-flight conflict detection."""
@@ -149,22 +155,19 @@ class DocumentProcessor:
             publisher = metadata.get("publisher")
 
             # Create reference stub with hash and filename before processing
-            processed_filenames = {p["new_filename"] for p in self.processed_files}
             stub = create_reference_stub(
                 file_path=file_path,
                 author=author,
                 title=title,
                 year=year if year != "n.d." else None,
                 publisher=publisher,
-                processed_files=processed_filenames,
+                processed_files=self.processed_filenames,
             )
 
             # Check for conflicts against existing references
             conflicts_found = []
 
-            hash_conflict = check_hash_conflict(
-                stub["file_hash"], self.existing_references
-            )
+            hash_conflict = self.references_by_hash.get(stub["file_hash"])
             if hash_conflict:
                 conflicts_found.append(
                     {
@@ -175,9 +178,7 @@ class DocumentProcessor:
                     }
                 )
 
-            filename_conflict = check_filename_conflict(
-                stub["filename"], self.existing_references
-            )
+            filename_conflict = self.references_by_filename.get(stub["filename"])
             if filename_conflict:
                 conflicts_found.append(
                     {
@@ -250,6 +251,8 @@ class DocumentProcessor:
                     "file_hash": stub["file_hash"],
                 }
             )
+            self.processed_by_name[new_filename] = file_path.name
+            self.processed_filenames.add(new_filename)
 
             return True
 
@@ -266,12 +269,24 @@ class DocumentProcessor:
         self.existing_references = load_references_json()
         print(f"  Found {len(self.existing_references)} existing entries")
 
-        # Scan files
-        all_files = list(TODO_DIR.glob("*"))
-        pdf_files = [f for f in all_files if f.suffix.lower() == ".pdf"]
-        non_pdf_files = [
-            f for f in all_files if f.suffix.lower() != ".pdf" and f.is_file()
-        ]
+        # Index by hash and filename so each conflict check is a dict lookup;
+        # keep the first entry per key
+        for entry in self.existing_references:
+            if entry.get("file_hash"):
+                self.references_by_hash.setdefault(entry["file_hash"], entry)
+            self.references_by_filename.setdefault(entry["filename"], entry)
+
+        # Scan files in a single directory pass; DirEntry.is_file() uses the
+        # type from the listing instead of a stat per file
+        pdf_files = []  # (path, DirEntry) pairs
+        non_pdf_files = []
+        with os.scandir(TODO_DIR) as it:
+            for entry in it:
+                path = Path(entry.path)
+                if path.suffix.lower() == ".pdf":
+                    pdf_files.append((path, entry))
+                elif entry.is_file():
+                    non_pdf_files.append(path)
 
         print(
             f"Found {len(pdf_files)} PDF files and {len(non_pdf_files)} non-PDF files"
@@ -281,8 +296,8 @@ class DocumentProcessor:
         small_pdfs = []
         large_pdfs = []
 
-        for pdf in pdf_files:
-            size = pdf.stat().st_size
+        for pdf, entry in pdf_files:
+            size = entry.stat().st_size
             if size >= MAX_FILE_SIZE:
                 large_pdfs.append(pdf)
                 self.skipped_large.append(f"{pdf.name} ({size / 1024 / 1024:.1f}MB)")
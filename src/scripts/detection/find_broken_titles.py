@@ -15,6 +15,45 @@ from src.lib.utils import load_references_json
 OUTPUT_JSON = JSON_OUTPUT_DIR / "broken_titles.json"
 
 
+# Patterns are compiled once at import; is_broken_title runs for every entry.
+# Each pattern list is folded into one alternation since a match on any of
+# them adds the same reason.
+
+# DEFINITELY BROKEN: Generic placeholder titles
+GENERIC_PLACEHOLDER_RE = re.compile(
+    r"^(?:My title|Untitled|untitled|Data Driven|Deep Learning|Machine Learning)$"
+)
+ISBN_RE = re.compile(r"^978\d{10}")
+FILE_EXTENSION_RE = re.compile(r"\.(pdf|dvi|tex|indd)$")
+VERY_SHORT_AMBIGUOUS_RE = re.compile(
+    r"^(?:IR_draft|SVMs|Dropout|backprop|Lecture \d+|nipstut\d+\.pdf)$"
+)
+PII_DOI_RE = re.compile(r"^(PII:|DOI:)")
+
+# OUT OF PLACE topics
+COOKING_RE = re.compile(r"(cookbook|recipe|hero veg|celebration.*hero)", re.IGNORECASE)
+ROMAN_RE = re.compile(r"roman sacrifice", re.IGNORECASE)
+MUSIC_RE = re.compile(r"sonic warfare|music science", re.IGNORECASE)
+
+# PROBABLY BROKEN: Metadata artifacts
+BROKEN_METADATA_RE = re.compile(
+    r"CITY UNIVERSITY$"
+    r"|Combined DVI Document"
+    r"|CIA Athens Document"
+    r"|Eriksson anomaly_$"
+    r"|The-Briefing-\d+-Print"
+    r"|Conference Proceedings Document$"
+    r"|Voice User Interface Document$",
+    re.IGNORECASE,
+)
+
+# SUSPICIOUS: Medical/clinical topics, unless clearly ML for medical
+MEDICAL_RE = re.compile(r"clinical|coronary|disease diagnosis|medical", re.IGNORECASE)
+ML_TOPIC_RE = re.compile(
+    r"machine learning|neural network|classification", re.IGNORECASE
+)
+
+
 def is_broken_title(title, author, filename):
     """
     Determine if a title is truly broken/problematic.
@@ -27,21 +66,11 @@ def is_broken_title(title, author, filename):
         reasons.append("Contains underscores - likely extraction error")
 
     # DEFINITELY BROKEN: Generic placeholder titles
-    generic_placeholders = [
-        r"^My title$",
-        r"^Untitled$",
-        r"^untitled$",
-        r"^Data Driven$",
-        r"^Deep Learning$",
-        r"^Machine Learning$",
-    ]
-    for pattern in generic_placeholders:
-        if re.match(pattern, title):
-            reasons.append("Generic placeholder title")
-            break
+    if GENERIC_PLACEHOLDER_RE.match(title):
+        reasons.append("Generic placeholder title")
 
     # DEFINITELY BROKEN: Titles that are ISBN codes
-    if re.match(r"^978\d{10}", title):
+    if ISBN_RE.match(title):
         reasons.append("Title is an ISBN code")
 
     # DEFINITELY BROKEN: Titles in ALL CAPS (except acronyms)
@@ -49,64 +78,41 @@ def is_broken_title(title, author, filename):
         reasons.append("All CAPS - formatting error")
 
     # DEFINITELY BROKEN: Titles that look like file formats/extensions
-    if re.search(r"\.(pdf|dvi|tex|indd)$", title.lower()):
+    if FILE_EXTENSION_RE.search(title.lower()):
         reasons.append("Contains file extension")
 
     # DEFINITELY BROKEN: Very short ambiguous titles
-    very_short_ambiguous = [
-        r"^IR_draft$",
-        r"^SVMs$",
-        r"^Dropout$",
-        r"^backprop$",
-        r"^Lecture \d+$",
-        r"^nipstut\d+\.pdf$",
-    ]
-    for pattern in very_short_ambiguous:
-        if re.match(pattern, title):
-            reasons.append("Very short/broken title")
-            break
+    if VERY_SHORT_AMBIGUOUS_RE.match(title):
+        reasons.append("Very short/broken title")
 
     # DEFINITELY BROKEN: Publisher/software names as titles
-    if re.match(r"^(PII:|DOI:)", title):
+    if PII_DOI_RE.match(title):
         reasons.append("PII/DOI code as title")
 
     # OUT OF PLACE: Cooking/food content
-    if re.search(r"(cookbook|recipe|hero veg|celebration.*hero)", title, re.IGNORECASE):
+    if COOKING_RE.search(title):
         reasons.append("Cooking/food content - out of place")
 
     # OUT OF PLACE: Roman archaeology/history (very off-topic)
-    if re.search(r"roman sacrifice", title, re.IGNORECASE):
+    if ROMAN_RE.search(title):
         reasons.append("Roman archaeology - completely off-topic")
 
     # OUT OF PLACE: Music/warfare topics (unless acoustic analysis or military AI)
-    if re.search(r"sonic warfare|music science", title, re.IGNORECASE):
+    if MUSIC_RE.search(title):
         reasons.append("Music/sound topic - likely off-topic")
 
     # PROBABLY BROKEN: Metadata artifacts
-    broken_metadata = [
-        r"CITY UNIVERSITY$",
-        r"Combined DVI Document",
-        r"CIA Athens Document",
-        r"Eriksson anomaly_$",
-        r"The-Briefing-\d+-Print",
-        r"Conference Proceedings Document$",
-        r"Voice User Interface Document$",
-    ]
-    for pattern in broken_metadata:
-        if re.search(pattern, title, re.IGNORECASE):
-            reasons.append("Metadata artifact/placeholder")
-            break
+    if BROKEN_METADATA_RE.search(title):
+        reasons.append("Metadata artifact/placeholder")
 
     # PROBABLY BROKEN: Line breaks in title (multiline extraction error)
     if "\n" in title:
         reasons.append("Title contains line break")
 
     # SUSPICIOUS: Medical/clinical topics (may or may not be relevant)
-    if re.search(r"clinical|coronary|disease diagnosis|medical", title, re.IGNORECASE):
+    if MEDICAL_RE.search(title):
         # Only flag if it's clearly medical, not ML for medical
-        if not re.search(
-            r"machine learning|neural network|classification", title, re.IGNORECASE
-        ):
+        if not ML_TOPIC_RE.search(title):
             reasons.append("Medical/clinical topic - possibly off-topic")
 
     return reasons
@@ -48,12 +48,13 @@ def main():
             "reasons": [],
         }
 
-        # Add reasons
-        if not author or author.strip() == "":
+        # Add reasons (normalize the author once)
+        stripped = author.strip() if author else ""
+        if not stripped:
             result["reasons"].append("Author field is empty")
-        elif author.strip().lower() == "unknown":
+        elif stripped.lower() == "unknown":
             result["reasons"].append('Author is "Unknown"')
-        elif author.strip() == "---":
+        elif stripped == "---":
             result["reasons"].append('Author is "---"')
 
         results.append(result)
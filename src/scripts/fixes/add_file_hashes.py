@@ -4,6 +4,9 @@ Add SHA256 file hash to each entry in references.json.
 This is a one-time operation to enable duplicate detection.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from src.lib.utils import (
     REFERENCE_DIR,
     load_references_json,
@@ -11,6 +14,9 @@ from src.lib.utils import (
     calculate_file_hash,
 )
 
+# hashlib releases the GIL while hashing, so threads overlap I/O and hashing
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
 
 def main():
     print("Adding file hashes to references.json...")
@@ -25,34 +31,38 @@ def main():
     already_had_hash = 0
     errors = []
 
-    print("Calculating hashes (this may take ~30 seconds)...")
-    print("")
-
-    for i, entry in enumerate(entries, 1):
+    # Collect entries that still need a hash
+    to_hash = []
+    for entry in entries:
         filename = entry["filename"]
 
         # Skip if already has hash
         if "file_hash" in entry and entry["file_hash"]:
             already_had_hash += 1
-            if i % 50 == 0:
-                print(f"  Progress: {i}/{len(entries)} files...")
             continue
 
-        # Calculate hash
         filepath = REFERENCE_DIR / filename
         if not filepath.exists():
             print(f"  [!] File not found: {filename}")
             errors.append(f"File not found: {filename}")
             continue
 
-        file_hash = calculate_file_hash(filepath)
-        if file_hash:
-            entry["file_hash"] = file_hash
-            updated += 1
+        to_hash.append((entry, filepath))
 
-        # Progress indicator
-        if i % 50 == 0:
-            print(f"  Progress: {i}/{len(entries)} files...")
+    print(f"Calculating {len(to_hash)} hashes with {MAX_WORKERS} workers...")
+    print("")
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # map yields hashes in input order as they complete
+        hashes = executor.map(calculate_file_hash, [path for _, path in to_hash])
+        for i, ((entry, _), file_hash) in enumerate(zip(to_hash, hashes), 1):
+            if file_hash:
+                entry["file_hash"] = file_hash
+                updated += 1
+
+            # Progress indicator
+            if i % 50 == 0:
+                print(f"  Progress: {i}/{len(to_hash)} files...")
 
     # Save updated references.json
     save_references_json(entries)
@@ -17,6 +17,7 @@ from src.lib.utils import (
     JSON_OUTPUT_DIR,
     parse_author,
     sanitize_title,
+    load_references_json,
     get_entry_from_references_json,
     remove_entry_from_references_json,
     update_entry_in_references_json,
@@ -28,14 +29,16 @@ from src.lib.utils import (
 INPUT_JSON = JSON_OUTPUT_DIR / "broken_titles.json"
 
 
-def process_entry(entry, processed_files):
+def process_entry(entry, processed_files, references_by_filename):
     """Process a single entry: determine new filename based on suggested metadata."""
     old_filename = entry["filename"]
     current_author = entry.get("author", "Unknown")
     current_title = entry.get("title", "Untitled")
 
     # Extract year/publisher from references.json
-    ref_entry = get_entry_from_references_json(old_filename)
+    ref_entry = references_by_filename.pop(old_filename, None)
+    if ref_entry is None:
+        ref_entry = get_entry_from_references_json(old_filename)
     current_year = ref_entry.get("year") if ref_entry else None
     current_publisher = ref_entry.get("publisher") if ref_entry else None
 
@@ -55,7 +58,7 @@ def process_entry(entry, processed_files):
         title_filename = "_".join(title_filename.split("_")[:10])
         new_filename = f"{author_filename}_{title_filename}.pdf"
 
-    is_quarantine = entry.get("quarantine") == True
+    is_quarantine = entry.get("quarantine") == True  # noqa: E712
     target_dir = QUARANTINE_DIR if is_quarantine else REFERENCE_DIR
 
     new_filename = check_duplicate_filename(new_filename, processed_files, target_dir)
@@ -89,8 +92,23 @@ def main():
     errors = []
     processed_files = set()
 
-    quarantine_entries = [e for e in entries if e.get("quarantine") == True]
-    regular_entries = [e for e in entries if not e.get("quarantine")]
+    # Index references.json by filename once. Each filename is popped on first
+    # use, so a repeated or since-changed filename falls back to a fresh lookup
+    references_by_filename = {}
+    for ref_entry in load_references_json():
+        references_by_filename.setdefault(ref_entry["filename"], ref_entry)
+
+    quarantine_entries = []
+    regular_entries = []
+    for e in entries:
+        if e.get("quarantine") == True:  # noqa: E712
+            quarantine_entries.append(e)
+        elif not e.get("quarantine"):
+            regular_entries.append(e)
+        else:
+            errors.append(
+                f"Invalid quarantine value {e['quarantine']!r}: {e['filename']}"
+            )
 
     # Step 1: Process quarantine entries
     print("Step 1: Processing quarantine entries...")
@@ -98,7 +116,7 @@ def main():
         old_filename = entry["filename"]
         print(f"  Processing: {old_filename}")
 
-        result = process_entry(entry, processed_files)
+        result = process_entry(entry, processed_files, references_by_filename)
         new_filename = result["new_filename"]
         old_path = REFERENCE_DIR / old_filename
 
@@ -138,7 +156,7 @@ def main():
             entries_skipped.append(old_filename)
             continue
 
-        result = process_entry(entry, processed_files)
+        result = process_entry(entry, processed_files, references_by_filename)
         new_filename = result["new_filename"]
         old_path = REFERENCE_DIR / old_filename
         new_path = REFERENCE_DIR / new_filename
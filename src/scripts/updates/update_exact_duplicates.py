@@ -43,11 +43,24 @@ def main():
 
     print(f"Total files to process: {len(all_files)}\n")
 
+    # Split into quarantine entries and non-quarantined entries with
+    # suggested fields in a single pass
+    quarantine_entries = []
+    update_entries = []
+    for f in all_files:
+        if f.get("quarantine") == True:  # noqa: E712
+            quarantine_entries.append(f)
+        elif (
+            f.get("suggested_author")
+            or f.get("suggested_title")
+            or f.get("suggested_year")
+        ):
+            update_entries.append(f)
+
     # Phase 1: Process quarantine entries
     print("PHASE 1: Processing quarantine entries...")
     print("-" * 70)
 
-    quarantine_entries = [f for f in all_files if f.get("quarantine") == True]
     print(f"Files to quarantine: {len(quarantine_entries)}\n")
 
     quarantined = 0
@@ -89,18 +102,6 @@ def main():
     print("PHASE 2: Processing metadata updates...")
     print("-" * 70)
 
-    # Filter for non-quarantined entries with suggested fields
-    update_entries = [
-        f
-        for f in all_files
-        if f.get("quarantine") != True
-        and (
-            f.get("suggested_author")
-            or f.get("suggested_title")
-            or f.get("suggested_year")
-        )
-    ]
-
     print(f"Files to update: {len(update_entries)}\n")
 
     updated = 0
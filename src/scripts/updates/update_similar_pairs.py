@@ -44,7 +44,7 @@ def flatten_files_from_pairs(pairs):
                     existing = files_dict[filename]
 
                     # Merge quarantine (true takes precedence)
-                    if file_entry.get("quarantine") == True:
+                    if file_entry.get("quarantine") == True:  # noqa: E712
                         existing["quarantine"] = True
 
                     # Merge suggested fields (non-null takes precedence)
@@ -77,11 +77,24 @@ def main():
     all_files = flatten_files_from_pairs(similar_pairs)
     print(f"Total unique files to process: {len(all_files)}\n")
 
+    # Split into quarantine entries and non-quarantined entries with
+    # suggested fields in a single pass
+    quarantine_entries = []
+    update_entries = []
+    for f in all_files:
+        if f.get("quarantine") == True:  # noqa: E712
+            quarantine_entries.append(f)
+        elif (
+            f.get("suggested_author")
+            or f.get("suggested_title")
+            or f.get("suggested_year")
+        ):
+            update_entries.append(f)
+
     # Phase 1: Process quarantine entries
     print("PHASE 1: Processing quarantine entries...")
     print("-" * 70)
 
-    quarantine_entries = [f for f in all_files if f.get("quarantine") == True]
     print(f"Files to quarantine: {len(quarantine_entries)}\n")
 
     quarantined = 0
@@ -123,34 +136,24 @@ def main():
     print("PHASE 2: Processing metadata updates...")
     print("-" * 70)
 
-    # Filter for non-quarantined entries with suggested fields
-    update_entries = [
-        f
-        for f in all_files
-        if f.get("quarantine") != True
-        and (
-            f.get("suggested_author")
-            or f.get("suggested_title")
-            or f.get("suggested_year")
-        )
-    ]
-
     print(f"Files to update: {len(update_entries)}\n")
 
     updated = 0
     update_errors = []
     processed_files = set()
 
+    # Index current metadata by filename once, keeping the first entry per
+    # filename. Each file appears once in update_entries, so entries renamed
+    # earlier in the loop are never looked up again.
+    references_by_filename = {}
+    for ref_entry in load_references_json():
+        references_by_filename.setdefault(ref_entry["filename"], ref_entry)
+
     for entry in update_entries:
         filename = entry["filename"]
 
         # Look up current metadata from references.json
-        current_entry = None
-        entries = load_references_json()
-        for ref_entry in entries:
-            if ref_entry["filename"] == filename:
-                current_entry = ref_entry
-                break
+        current_entry = references_by_filename.get(filename)
 
         if not current_entry:
             print(f"  [!] File not found in references.json: {filename}")
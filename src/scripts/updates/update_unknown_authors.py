@@ -12,6 +12,7 @@ from src.lib.utils import (
     QUARANTINE_DIR,
     MARKDOWN_DIR,
     JSON_OUTPUT_DIR,
+    load_references_json,
     get_entry_from_references_json,
     update_entry_in_references_json,
     remove_entry_from_references_json,
@@ -19,10 +20,11 @@ from src.lib.utils import (
     sanitize_title,
     check_duplicate_filename,
     rename_file,
-    regenerate_references_md,
 )
+from src.scripts.core.generate_references_md import generate_markdown
 
 INPUT_JSON = JSON_OUTPUT_DIR / "unknown_authors.json"
+SUGGESTION_KEYS = ("suggested_author", "suggested_title", "suggested_year")
 
 
 def main():
@@ -41,11 +43,24 @@ def main():
     errors = []
     processed_files = set()
 
+    # Index references.json by filename once. Each filename is popped on first
+    # use, so a repeated or since-changed filename falls back to a fresh lookup
+    references_by_filename = {}
+    for ref_entry in load_references_json():
+        references_by_filename.setdefault(ref_entry["filename"], ref_entry)
+
+    # Split entries into quarantine / regular in a single pass
+    quarantine_entries = []
+    regular_entries = []
+    for e in entries:
+        if e.get("quarantine") == True:  # noqa: E712
+            quarantine_entries.append(e)
+        else:
+            regular_entries.append(e)
+
     # =========================================================================
     # PHASE 1: Process quarantine entries
     # =========================================================================
-    quarantine_entries = [e for e in entries if e.get("quarantine") == True]
-
     if quarantine_entries:
         print(f"{'=' * 70}")
         print(f"PHASE 1: Processing {len(quarantine_entries)} quarantine entries")
@@ -59,7 +74,9 @@ def main():
             print(f"[{i}/{len(quarantine_entries)}] Processing: {old_filename}")
 
             # Get current entry from references.json
-            current_entry = get_entry_from_references_json(old_filename)
+            current_entry = references_by_filename.pop(old_filename, None)
+            if current_entry is None:
+                current_entry = get_entry_from_references_json(old_filename)
             if not current_entry:
                 print(f"  [!] Entry not found in references.json")
                 errors.append(f"Entry not found in references.json: {old_filename}")
@@ -132,8 +149,6 @@ def main():
     # =========================================================================
     # PHASE 2: Process regular entries
     # =========================================================================
-    regular_entries = [e for e in entries if e.get("quarantine") != True]
-
     if regular_entries:
         print(f"\n{'=' * 70}")
         print(f"PHASE 2: Processing {len(regular_entries)} regular entries")
@@ -145,11 +160,7 @@ def main():
             print(f"[{i}/{len(regular_entries)}] Processing: {old_filename}")
 
             # Check if there are any suggestions
-            has_suggestions = (
-                entry.get("suggested_author") is not None
-                or entry.get("suggested_title") is not None
-                or entry.get("suggested_year") is not None
-            )
+            has_suggestions = any(entry.get(k) is not None for k in SUGGESTION_KEYS)
 
             if not has_suggestions:
                 print(f"  -> No suggestions, skipping")
@@ -157,7 +168,9 @@ def main():
                 continue
 
             # Get current entry from references.json
-            current_entry = get_entry_from_references_json(old_filename)
+            current_entry = references_by_filename.pop(old_filename, None)
+            if current_entry is None:
+                current_entry = get_entry_from_references_json(old_filename)
             if not current_entry:
                 print(f"  [!] Entry not found in references.json")
                 errors.append(f"Entry not found in references.json: {old_filename}")
@@ -230,7 +243,7 @@ def main():
                             "author": final_author,
                             "title": final_title,
                             "year": final_year,
-                            "changes": ["year"] if year_changed else [],
+                            "changes": ("year",) if year_changed else (),
                         }
                     )
                 else:
@@ -265,13 +278,15 @@ def main():
                 errors.append(f"Entry not found in references.json: {old_filename}")
 
             # Track changes
-            changes = []
-            if author_changed:
-                changes.append("author")
-            if title_changed:
-                changes.append("title")
-            if year_changed:
-                changes.append("year")
+            changes = tuple(
+                field
+                for field, changed in (
+                    ("author", author_changed),
+                    ("title", title_changed),
+                    ("year", year_changed),
+                )
+                if changed
+            )
 
             entries_updated.append(
                 {
@@ -290,7 +305,20 @@ def main():
     if quarantined or entries_updated:
         print(f"\n{'=' * 70}")
         print("Generating references.md from JSON...")
-        if regenerate_references_md():
+        # Only re-render entries touched in phases 1/2 (old and new names).
+        # utils.regenerate_references_md() always rebuilds the whole file, so
+        # the generator is called directly to pass the dirty set.
+        dirty = {e["old_filename"] for e in quarantined}
+        for e in entries_updated:
+            dirty.add(e["old_filename"])
+            dirty.add(e["new_filename"])
+        try:
+            generated = generate_markdown(dirty=dirty)
+        except Exception as exc:
+            print(f"  [!] {type(exc).__name__}: {exc}")
+            errors.append(f"references.md generation failed: {exc}")
+            generated = False
+        if generated:
             print("✓ References.md generated successfully")
         else:
             print("⚠ Warning: generate_references_md.py failed")
@@ -311,47 +339,49 @@ def main():
         for err in errors:
             print(f"  - {err}")
 
-    # Save log
+    # Save log (built in memory, written in one call)
+    parts = [
+        "# Unknown Authors Update Log\n\n",
+        f"- **Files updated**: {len(entries_updated)}\n",
+        f"- **Files quarantined**: {len(quarantined)}\n",
+        f"- **Files skipped**: {len(entries_skipped)}\n",
+        f"- **Errors**: {len(errors)}\n\n",
+    ]
+
+    if quarantined:
+        parts.append("## Files Quarantined\n\n")
+        for entry in quarantined:
+            parts.append(
+                f"- {entry['old_filename']} → quarantine/{entry['new_filename']}\n"
+            )
+            parts.append(f"  - Author: {entry['author']}\n")
+            parts.append(f"  - Title: {entry['title']}\n")
+        parts.append("\n")
+
+    if entries_updated:
+        parts.append("## Files Updated\n\n")
+        for entry in entries_updated:
+            parts.append(f"- {entry['old_filename']} → {entry['new_filename']}\n")
+            parts.append(f"  - Author: {entry['author']}\n")
+            parts.append(f"  - Title: {entry['title']}\n")
+            if entry.get("year"):
+                parts.append(f"  - Year: {entry['year']}\n")
+            if entry.get("changes"):
+                parts.append(f"  - Changed: {', '.join(entry['changes'])}\n")
+        parts.append("\n")
+
+    if entries_skipped:
+        parts.append("## Files Skipped (No Suggestions)\n\n")
+        parts.extend(f"- {filename}\n" for filename in entries_skipped)
+        parts.append("\n")
+
+    if errors:
+        parts.append("## Errors\n\n")
+        parts.extend(f"- {err}\n" for err in errors)
+
     log_file = MARKDOWN_DIR / "unknown_authors_update_log.md"
     with open(log_file, "w", encoding="utf-8") as f:
-        f.write("# Unknown Authors Update Log\n\n")
-        f.write(f"- **Files updated**: {len(entries_updated)}\n")
-        f.write(f"- **Files quarantined**: {len(quarantined)}\n")
-        f.write(f"- **Files skipped**: {len(entries_skipped)}\n")
-        f.write(f"- **Errors**: {len(errors)}\n\n")
-
-        if quarantined:
-            f.write("## Files Quarantined\n\n")
-            for entry in quarantined:
-                f.write(
-                    f"- {entry['old_filename']} → quarantine/{entry['new_filename']}\n"
-                )
-                f.write(f"  - Author: {entry['author']}\n")
-                f.write(f"  - Title: {entry['title']}\n")
-            f.write("\n")
-
-        if entries_updated:
-            f.write("## Files Updated\n\n")
-            for entry in entries_updated:
-                f.write(f"- {entry['old_filename']} → {entry['new_filename']}\n")
-                f.write(f"  - Author: {entry['author']}\n")
-                f.write(f"  - Title: {entry['title']}\n")
-                if entry.get("year"):
-                    f.write(f"  - Year: {entry['year']}\n")
-                if entry.get("changes"):
-                    f.write(f"  - Changed: {', '.join(entry['changes'])}\n")
-            f.write("\n")
-
-        if entries_skipped:
-            f.write("## Files Skipped (No Suggestions)\n\n")
-            for filename in entries_skipped:
-                f.write(f"- {filename}\n")
-            f.write("\n")
-
-        if errors:
-            f.write("## Errors\n\n")
-            for err in errors:
-                f.write(f"- {err}\n")
+        f.write("".join(parts))
 
     print(f"\n[OK] Log saved to: {log_file}")
     print("=" * 70)
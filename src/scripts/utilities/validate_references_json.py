@@ -4,40 +4,69 @@ Validate that references.json contains all entries from references.md
 with no changes to the data.
 """
 
+import mmap
+import os
 import re
-import json
 from pathlib import Path
-from src.lib.config import REFERENCES_FILE
-
 
-def parse_references_md():
-    """Parse references.md (same as conversion script)."""
-    with open(REFERENCES_FILE, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    entries = []
-    pattern = (
-        r"([^\n]+?)\s+\(([^)]+)\)\s+\*([^*]+)\*\.([^\n]*)\n\*\*File\*\*:\s+([^\n]+)"
-    )
-    matches = re.finditer(pattern, content)
-
-    for match in matches:
-        entry = {
-            "author": match.group(1).strip(),
-            "year": match.group(2).strip(),
-            "title": match.group(3).strip(),
-            "publisher": match.group(4).strip(),
-            "filename": match.group(5).strip(),
+from src.lib.config import REFERENCES_FILE
+from src.scripts.core.generate_references_md import load_json
+
+# Bytes \s only matches ASCII whitespace; this also matches the UTF-8
+# encodings of every other character str \s matches (e.g. U+00A0, U+3000)
+UTF8_SPACE = (
+    rb"(?:[\s\x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80"
+    rb"|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)+"
+)
+
+# Same entry pattern as the conversion script, compiled for bytes so it can
+# scan a memory-mapped file
+ENTRY_PATTERN = re.compile(
+    rb"([^\n]+?)"
+    + UTF8_SPACE
+    + rb"\(([^)]+)\)"
+    + UTF8_SPACE
+    + rb"\*([^*]+)\*\.([^\n]*)\n\*\*File\*\*:"
+    + UTF8_SPACE
+    + rb"([^\n]+)"
+)
+
+
+def iter_entry_matches():
+    """Yield entry matches from a read-only mmap of references.md."""
+    with open(REFERENCES_FILE, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from ENTRY_PATTERN.finditer(mm)
+
+
+def iter_references_md():
+    """Yield parsed entries from references.md one at a time."""
+    for match in iter_entry_matches():
+        author, year, title, publisher, filename = (
+            group.decode("utf-8").strip() for group in match.groups()
+        )
+        yield {
+            "author": author,
+            "year": year,
+            "title": title,
+            "publisher": publisher,
+            "filename": filename,
         }
-        entries.append(entry)
 
-    return entries
+
+def iter_references_md_filenames():
+    """Yield only the filenames from references.md."""
+    for match in iter_entry_matches():
+        yield match.group(5).decode("utf-8").strip()
 
 
-def load_json(json_path):
-    """Load JSON file."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def parse_references_md():
+    """Parse references.md (same as conversion script)."""
+    return list(iter_references_md())
 
 
 def validate():
@@ -49,13 +78,12 @@ def validate():
         return False
 
     print("Parsing references.md...")
-    md_entries = parse_references_md()
+    md_filenames = set(iter_references_md_filenames())
 
     print("Loading references.json...")
     json_entries = load_json(json_path)
 
     # Extract filename sets
-    md_filenames = {e["filename"] for e in md_entries}
     json_filenames = {e["filename"] for e in json_entries}
 
     print(f"\nValidation:")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Unit tests for generate_references_md.py"""
+
+import json
+import pytest
+from pathlib import Path
+
+# Import the module under test
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scripts.core import generate_references_md
+
+
+def make_entry(filename, author, title, year="2020", publisher=""):
+    """Build a references.json entry."""
+    return {
+        "filename": filename,
+        "author": author,
+        "year": year,
+        "title": title,
+        "publisher": publisher,
+    }
+
+
+class TestPatchMarkdown:
+    """Tests for incremental regeneration via generate_markdown(dirty=...)."""
+
+    @pytest.fixture
+    def setup_md_env(self, tmp_path, monkeypatch):
+        """Point the generator at temporary references.json/md files."""
+        json_file = tmp_path / "references.json"
+        md_file = tmp_path / "references.md"
+        monkeypatch.setattr(generate_references_md, "REFERENCES_JSON", json_file)
+        monkeypatch.setattr(generate_references_md, "REFERENCES_FILE", md_file)
+        return json_file, md_file
+
+    def test_multiline_block_kept(self, setup_md_env):
+        """Untouched blocks spanning several lines are kept whole."""
+        json_file, md_file = setup_md_env
+        entries = [
+            make_entry("Smith_Alpha.pdf", "John Smith", "Alpha"),
+            make_entry("Doe_Broken_Title.pdf", "Jane Doe", "Broken\nTitle", "2019"),
+        ]
+        json_file.write_text(json.dumps(entries))
+        assert generate_references_md.generate_markdown()
+        full = md_file.read_text(encoding="utf-8")
+
+        assert generate_references_md.generate_markdown(dirty={"Smith_Alpha.pdf"})
+        assert md_file.read_text(encoding="utf-8") == full
+
+    def test_dirty_entry_rerendered(self, setup_md_env):
+        """Renamed entries are replaced and the result matches a full rebuild."""
+        json_file, md_file = setup_md_env
+        entries = [
+            make_entry("Smith_Alpha.pdf", "John Smith", "Alpha"),
+            make_entry("Doe_Broken_Title.pdf", "Jane Doe", "Broken\nTitle", "2019"),
+        ]
+        json_file.write_text(json.dumps(entries))
+        generate_references_md.generate_markdown()
+
+        entries[0] = make_entry("Smith_Beta.pdf", "John Smith", "Beta")
+        json_file.write_text(json.dumps(entries))
+        generate_references_md.generate_markdown(
+            dirty={"Smith_Alpha.pdf", "Smith_Beta.pdf"}
+        )
+        patched = md_file.read_text(encoding="utf-8")
+
+        generate_references_md.generate_markdown()
+        assert patched == md_file.read_text(encoding="utf-8")
+        assert "Smith_Alpha.pdf" not in patched
+
+    def test_unrecognised_layout_rebuilds(self, setup_md_env):
+        """A references.md without the expected header is rebuilt in full."""
+        json_file, md_file = setup_md_env
+        json_file.write_text(
+            json.dumps([make_entry("Smith_Alpha.pdf", "John Smith", "Alpha")])
+        )
+        md_file.write_text("stray text\n", encoding="utf-8")
+
+        assert generate_references_md.generate_markdown(dirty={"Smith_Alpha.pdf"})
+        content = md_file.read_text(encoding="utf-8")
+        assert content.startswith("# References\n")
+        assert "stray text" not in content
+        assert "**File**: Smith_Alpha.pdf" in content
+
+    def test_failed_write_removes_temp_file(self, setup_md_env):
+        """A write that fails leaves references.md untouched and no temp file."""
+        json_file, md_file = setup_md_env
+        md_file.write_text("original\n", encoding="utf-8")
+
+        with pytest.raises(UnicodeEncodeError):
+            generate_references_md.write_atomic(["bad \udc80 text\n"])
+
+        assert md_file.read_text(encoding="utf-8") == "original\n"
+        assert not md_file.with_suffix(".md.tmp").exists()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Unit tests for validate_references_json.py"""
+
+import re
+import pytest
+from pathlib import Path
+
+# Import the module under test
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scripts.utilities import validate_references_json
+
+# The str pattern parse_references_md used before it scanned an mmap
+STR_ENTRY_PATTERN = re.compile(
+    r"([^\n]+?)\s+\(([^)]+)\)\s+\*([^*]+)\*\.([^\n]*)\n\*\*File\*\*:\s+([^\n]+)"
+)
+
+
+def parse_with_str_pattern(content):
+    """Parse references.md content the way the str-based parser did."""
+    return [
+        {
+            "author": match.group(1).strip(),
+            "year": match.group(2).strip(),
+            "title": match.group(3).strip(),
+            "publisher": match.group(4).strip(),
+            "filename": match.group(5).strip(),
+        }
+        for match in STR_ENTRY_PATTERN.finditer(content)
+    ]
+
+
+class TestParseReferencesMd:
+    """Tests for parse_references_md() over a memory-mapped file."""
+
+    @pytest.fixture
+    def setup_md_env(self, tmp_path, monkeypatch):
+        """Point the parser at a temporary references.md."""
+        md_file = tmp_path / "references.md"
+        monkeypatch.setattr(validate_references_json, "REFERENCES_FILE", md_file)
+        return md_file
+
+    def test_empty_file(self, setup_md_env):
+        """An empty references.md yields no entries."""
+        setup_md_env.write_bytes(b"")
+        assert validate_references_json.parse_references_md() == []
+
+    def test_ascii_entries(self, setup_md_env):
+        """Plain entries parse the same as with the str pattern."""
+        content = (
+            "# References\n\n"
+            "John Smith (2020) *Test Title*. Publisher.\n"
+            "**File**: Smith_Test_Title.pdf\n\n"
+            "Jane Doe (n.d.) *Untitled*.\n"
+            "**File**: Doe_Untitled.pdf\n"
+        )
+        setup_md_env.write_text(content, encoding="utf-8")
+        entries = validate_references_json.parse_references_md()
+        assert entries == parse_with_str_pattern(content)
+        assert len(entries) == 2
+
+    def test_non_ascii_entries(self, setup_md_env):
+        """Non-ASCII text and Unicode whitespace parse the same as with str."""
+        content = (
+            "# References\n\n"
+            "José Müller (2019) *Über Maschinelles Lernen*. Springer.\n"
+            "**File**: Müller_Über_Maschinelles_Lernen.pdf\n\n"
+            "Jane\u00a0Doe\u00a0(2018)\u00a0*Non-breaking\u00a0Spaces*.\n"
+            "**File**:\u00a0Doe_Non-breaking_Spaces.pdf\n\n"
+            "李 华\u3000(2021)\u3000*机器学习*.\n"
+            "**File**:\u3000Li_机器学习.pdf\n"
+        )
+        setup_md_env.write_text(content, encoding="utf-8")
+        entries = validate_references_json.parse_references_md()
+        assert entries == parse_with_str_pattern(content)
+        assert [e["filename"] for e in entries] == [
+            "Müller_Über_Maschinelles_Lernen.pdf",
+            "Doe_Non-breaking_Spaces.pdf",
+            "Li_机器学习.pdf",
+        ]